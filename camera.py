@@ -22,6 +22,9 @@ from urllib.parse import urlparse
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Supported camera types
+_CAMERA_TYPES = frozenset(("usb", "csi", "ip"))
+
 
 class CameraError(Exception):
     """Custom exception for camera-related errors"""
@@ -57,7 +60,7 @@ class JetsonCamera:
         self.is_connected = False
         
         # Validate camera type
-        if self.camera_type not in ["usb", "csi", "ip"]:
+        if self.camera_type not in _CAMERA_TYPES:
             raise CameraError(f"Unsupported camera type: {camera_type}")
         
         # Validate IP URL if IP camera
@@ -50,6 +50,12 @@ class LidarType(Enum):
     GENERIC_UDP = "generic_udp"
 
 
+# LIDAR types grouped by transport, used for connection dispatch
+_SERIAL_LIDAR_TYPES = frozenset((LidarType.RPLIDAR, LidarType.YDLIDAR,
+                                 LidarType.HOKUYO_URG, LidarType.GENERIC_SERIAL))
+_NETWORK_LIDAR_TYPES = frozenset((LidarType.SICK_TIM, LidarType.GENERIC_UDP))
+
+
 @dataclass
 class LidarPoint:
     """Single LIDAR measurement point"""
@@ -120,10 +126,9 @@ class JetsonLidar:
             bool: True if connection successful
         """
         try:
-            if self.lidar_type in [LidarType.RPLIDAR, LidarType.YDLIDAR, 
-                                 LidarType.HOKUYO_URG, LidarType.GENERIC_SERIAL]:
+            if self.lidar_type in _SERIAL_LIDAR_TYPES:
                 return self._connect_serial()
-            elif self.lidar_type in [LidarType.SICK_TIM, LidarType.GENERIC_UDP]:
+            elif self.lidar_type in _NETWORK_LIDAR_TYPES:
                 return self._connect_network()
             else:
                 raise LidarError(f"Unsupported LIDAR type: {self.lidar_type}")
@@ -401,6 +406,9 @@ class JetsonLidar:
                         break
                     data_lines.append(data_line)
                 
+                # All points in the block were read together, so share one timestamp
+                scan_time = time.time()
+                
                 # Parse distance data
                 for i, distance_str in enumerate(''.join(data_lines)):
                     if distance_str.isdigit():
@@ -411,13 +419,13 @@ class JetsonLidar:
                             angle=angle,
                             distance=distance,
                             quality=255,
-                            timestamp=time.time()
+                            timestamp=scan_time
                         )
                         points.append(point)
                 
                 return LidarScan(
                     points=points,
-                    timestamp=time.time(),
+                    timestamp=scan_time,
                     scan_id=self.scan_id
                 )
         except Exception as e:
@@ -20,7 +20,9 @@ import json
 import logging
 import argparse
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 
 # Import SDK modules
@@ -38,6 +40,39 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# LIDAR type names accepted by setup_lidar()
+_LIDAR_TYPE_MAP = {lidar_type.value: lidar_type for lidar_type in LidarType}
+
+# Maximum image writes queued or in progress before new frames are dropped
+_MAX_PENDING_IMAGE_WRITES = 4
+
+
+def _on_image_written(image_filename: str, data: dict, stats: dict,
+                      stats_lock: threading.Lock,
+                      pending_writes: threading.BoundedSemaphore, future):
+    """
+    Record the outcome of a background image write in its capture record
+    
+    Runs on the writer thread, so it only touches the objects it is given
+    and never the SDK instance itself.
+    """
+    try:
+        if not future.result():
+            raise IOError("cv2.imwrite returned False")
+        data["camera"]["saved"] = True
+        with stats_lock:
+            stats["images_captured"] += 1
+    except Exception as e:
+        error_msg = f"Failed to write image {image_filename}: {e}"
+        data["camera"]["success"] = False
+        data["camera"]["saved"] = False
+        data["errors"].append(error_msg)
+        logger.error(error_msg)
+        with stats_lock:
+            stats["errors"] += 1
+    finally:
+        pending_writes.release()
+
 
 class JetsonSDK:
     """
@@ -61,9 +96,16 @@ class JetsonSDK:
         # Data collection
         self.is_running = False
         self.data_thread = None
+        self.stop_event = threading.Event()
         self.collected_data = []
         
-        # Statistics
+        # Background writer so JPEG encoding and disk I/O don't stall capture.
+        # Created on first use; pending_writes bounds the frames it holds.
+        self.image_writer = None
+        self.pending_writes = threading.BoundedSemaphore(_MAX_PENDING_IMAGE_WRITES)
+        
+        # Statistics (shared with the capture and image writer threads)
+        self.stats_lock = threading.Lock()
         self.stats = {
             "images_captured": 0,
             "lidar_scans": 0,
@@ -98,11 +140,23 @@ class JetsonSDK:
         }
         
         # Save hardware detection results
-        with open(self.output_dir / "hardware_detection.json", "w") as f:
-            json.dump(hardware, f, indent=2)
+        self._save_json("hardware_detection.json", hardware)
         
         return hardware
     
+    def _save_json(self, filename: str, data):
+        """
+        Save data as JSON in the output directory
+        
+        Serializes to a string first so the file is written in a single call
+        rather than token by token, as json.dump does.
+        
+        Args:
+            filename: Output filename relative to the output directory
+            data: JSON-serializable data
+        """
+        (self.output_dir / filename).write_text(json.dumps(data, indent=2))
+    
     def setup_camera(self, camera_type: str = "usb", camera_id: int = 0, 
                     ip_url: str = None) -> bool:
         """
@@ -159,16 +213,7 @@ class JetsonSDK:
             logger.info(f"Setting up {lidar_type} LIDAR...")
             
             # Map string to enum
-            lidar_type_map = {
-                "rplidar": LidarType.RPLIDAR,
-                "ydlidar": LidarType.YDLIDAR,
-                "hokuyo_urg": LidarType.HOKUYO_URG,
-                "sick_tim": LidarType.SICK_TIM,
-                "generic_serial": LidarType.GENERIC_SERIAL,
-                "generic_udp": LidarType.GENERIC_UDP
-            }
-            
-            lidar_enum = lidar_type_map.get(lidar_type, LidarType.GENERIC_SERIAL)
+            lidar_enum = _LIDAR_TYPE_MAP.get(lidar_type, LidarType.GENERIC_SERIAL)
             
             self.lidar = JetsonLidar(
                 lidar_type=lidar_enum,
@@ -189,10 +234,14 @@ class JetsonSDK:
             logger.error(f"LIDAR setup error: {e}")
             return False
     
-    def capture_single_data(self) -> dict:
+    def capture_single_data(self, background_write: bool = False) -> dict:
         """
         Capture a single set of camera and LIDAR data
         
+        Args:
+            background_write: Queue the image on the background writer instead
+                of writing it before returning (used by continuous capture)
+        
         Returns:
             dict: Captured data with timestamps
         """
@@ -210,28 +259,19 @@ class JetsonSDK:
             try:
                 ret, frame = self.camera.capture_frame()
                 if ret:
-                    # Save image
                     image_filename = f"image_{int(timestamp)}.jpg"
-                    image_path = self.output_dir / image_filename
-                    
-                    import cv2
-                    cv2.imwrite(str(image_path), frame)
-                    
-                    data["camera"] = {
-                        "filename": image_filename,
-                        "shape": frame.shape,
-                        "success": True
-                    }
-                    self.stats["images_captured"] += 1
-                    logger.info(f"Image captured: {image_filename}")
+                    if background_write:
+                        self._queue_image_write(data, image_filename, frame)
+                    else:
+                        self._save_image(data, image_filename, frame)
                 else:
                     data["errors"].append("Failed to capture camera frame")
-                    self.stats["errors"] += 1
+                    self._increment_stat("errors")
             except Exception as e:
                 error_msg = f"Camera capture error: {e}"
                 data["errors"].append(error_msg)
                 logger.error(error_msg)
-                self.stats["errors"] += 1
+                self._increment_stat("errors")
         
         # Capture LIDAR data
         if self.lidar:
@@ -248,15 +288,95 @@ class JetsonSDK:
                     logger.info(f"LIDAR measurement: {measurement.distance}mm at {measurement.angle}°")
                 else:
                     data["errors"].append("Failed to get LIDAR measurement")
-                    self.stats["errors"] += 1
+                    self._increment_stat("errors")
             except Exception as e:
                 error_msg = f"LIDAR capture error: {e}"
                 data["errors"].append(error_msg)
                 logger.error(error_msg)
-                self.stats["errors"] += 1
+                self._increment_stat("errors")
         
         return data
     
+    def _save_image(self, data: dict, image_filename: str, frame):
+        """
+        Write a captured frame to the output directory before returning
+        
+        Args:
+            data: Capture record to update
+            image_filename: Output filename relative to the output directory
+            frame: Captured frame
+        """
+        import cv2
+        if not cv2.imwrite(str(self.output_dir / image_filename), frame):
+            raise IOError(f"cv2.imwrite failed for {image_filename}")
+        
+        data["camera"] = {
+            "filename": image_filename,
+            "shape": frame.shape,
+            "success": True,
+            "saved": True
+        }
+        self._increment_stat("images_captured")
+        logger.info(f"Image captured: {image_filename}")
+    
+    def _queue_image_write(self, data: dict, image_filename: str, frame):
+        """
+        Queue a captured frame for writing by the background image writer
+        
+        The capture record's camera entry has "saved" set to None while the
+        write is pending, then True or False once it completes; a failed
+        write also clears "success" and adds to the record's errors. Frames
+        are dropped if too many writes are already pending.
+        
+        Args:
+            data: Capture record to update
+            image_filename: Output filename relative to the output directory
+            frame: Captured frame
+        """
+        if not self.pending_writes.acquire(blocking=False):
+            error_msg = f"Image write queue full, dropping frame {image_filename}"
+            data["errors"].append(error_msg)
+            logger.warning(error_msg)
+            self._increment_stat("errors")
+            return
+        
+        data["camera"] = {
+            "filename": image_filename,
+            "shape": frame.shape,
+            "success": True,
+            "saved": None
+        }
+        
+        try:
+            if self.image_writer is None:
+                self.image_writer = ThreadPoolExecutor(max_workers=1,
+                                                       thread_name_prefix="image_writer")
+            
+            import cv2
+            future = self.image_writer.submit(cv2.imwrite,
+                                              str(self.output_dir / image_filename), frame)
+        except Exception:
+            data["camera"] = None
+            self.pending_writes.release()
+            raise
+        
+        future.add_done_callback(partial(
+            _on_image_written, image_filename, data, self.stats,
+            self.stats_lock, self.pending_writes
+        ))
+        logger.info(f"Image captured: {image_filename}")
+    
+    def _flush_image_writes(self):
+        """Wait for pending image writes and release the writer thread"""
+        if self.image_writer is not None:
+            self.image_writer.shutdown(wait=True)
+            self.image_writer = None
+    
+    def _increment_stat(self, key: str, amount: int = 1):
+        """Increment a statistics counter under the stats lock"""
+        with self.stats_lock:
+            self.stats[key] += amount
+    
     def start_continuous_capture(self, interval: float = 1.0, duration: float = None):
         """
         Start continuous data capture
@@ -270,28 +390,42 @@ class JetsonSDK:
             return
         
         self.is_running = True
+        self.stop_event.clear()
         self.stats["start_time"] = time.time()
         
         logger.info(f"Starting continuous capture (interval: {interval}s, duration: {duration}s)")
         
         def capture_loop():
-            start_time = time.time()
+            # Duration and pacing both use the monotonic clock so a wall-clock
+            # step (e.g. NTP sync after boot) can't cut short or stretch the run
+            start_time = time.monotonic()
+            next_capture = start_time
             
             while self.is_running:
                 # Check duration limit
-                if duration and (time.time() - start_time) >= duration:
+                if duration and (time.monotonic() - start_time) >= duration:
                     logger.info("Duration limit reached, stopping capture")
                     break
                 
                 # Capture data
-                data = self.capture_single_data()
+                data = self.capture_single_data(background_write=True)
                 self.collected_data.append(data)
                 
                 # Update statistics
-                self.stats["runtime"] = time.time() - self.stats["start_time"]
+                with self.stats_lock:
+                    self.stats["runtime"] = time.time() - self.stats["start_time"]
+                
+                # Schedule against a fixed deadline so capture time doesn't add drift
+                next_capture += interval
+                delay = next_capture - time.monotonic()
+                if delay < 0:
+                    # Capture overran the interval; resync rather than burst
+                    next_capture = time.monotonic()
+                    delay = 0
                 
-                # Wait for next capture
-                time.sleep(interval)
+                # Wait for next capture (returns early when stopped)
+                if self.stop_event.wait(delay):
+                    break
             
             self.is_running = False
             logger.info("Continuous capture stopped")
@@ -308,15 +442,18 @@ class JetsonSDK:
         
         logger.info("Stopping continuous capture...")
         self.is_running = False
+        self.stop_event.set()
         
         if self.data_thread:
             self.data_thread.join(timeout=5.0)
         
+        # Make sure every capture record has its final image write status
+        self._flush_image_writes()
+        
         # Save collected data
         if self.collected_data:
             data_filename = f"capture_data_{int(time.time())}.json"
-            with open(self.output_dir / data_filename, "w") as f:
-                json.dump(self.collected_data, f, indent=2)
+            self._save_json(data_filename, self.collected_data)
             
             logger.info(f"Saved {len(self.collected_data)} data points to {data_filename}")
     
@@ -327,7 +464,8 @@ class JetsonSDK:
         Returns:
             dict: Statistics information
         """
-        stats = self.stats.copy()
+        with self.stats_lock:
+            stats = self.stats.copy()
         
         if stats["start_time"]:
             stats["runtime"] = time.time() - stats["start_time"]
@@ -392,8 +530,7 @@ class JetsonSDK:
         logger.info(f"Demo completed. Final stats: {final_stats}")
         
         # Save final statistics
-        with open(self.output_dir / "demo_statistics.json", "w") as f:
-            json.dump(final_stats, f, indent=2)
+        self._save_json("demo_statistics.json", final_stats)
     
     def cleanup(self):
         """Cleanup resources"""
@@ -403,6 +540,9 @@ class JetsonSDK:
         if self.is_running:
             self.stop_continuous_capture()
         
+        # Flush pending image writes
+        self._flush_image_writes()
+        
         # Disconnect devices
         if self.camera:
             self.camera.disconnect()
@@ -17,6 +17,7 @@ import os
 import sys
 import time
 import json
+import shutil
 import logging
 import unittest
 from unittest.mock import Mock, patch, MagicMock
@@ -46,9 +47,7 @@ class TestJetsonCamera(unittest.TestCase):
         """Clean up test fixtures"""
         # Clean up test files
         if self.test_output_dir.exists():
-            for file in self.test_output_dir.glob("*"):
-                file.unlink()
-            self.test_output_dir.rmdir()
+            shutil.rmtree(self.test_output_dir)
     
     def test_camera_initialization(self):
         """Test camera initialization with different parameters"""
@@ -246,13 +245,7 @@ class TestJetsonSDK(unittest.TestCase):
         
         # Clean up test files
         if self.test_output_dir.exists():
-            for file in self.test_output_dir.rglob("*"):
-                if file.is_file():
-                    file.unlink()
-            for dir in sorted(self.test_output_dir.rglob("*"), reverse=True):
-                if dir.is_dir():
-                    dir.rmdir()
-            self.test_output_dir.rmdir()
+            shutil.rmtree(self.test_output_dir)
     
     def test_sdk_initialization(self):
         """Test SDK initialization"""
@@ -306,6 +299,30 @@ class TestJetsonSDK(unittest.TestCase):
         self.assertIn("lidar_scans", stats)
         self.assertIn("errors", stats)
     
+    def test_stop_continuous_capture_interrupts_wait(self):
+        """Test that stopping capture does not wait out the interval"""
+        self.sdk.start_continuous_capture(interval=10.0)
+        
+        start_time = time.time()
+        self.sdk.stop_continuous_capture()
+        
+        self.assertLess(time.time() - start_time, 1.0)
+        self.assertFalse(self.sdk.data_thread.is_alive())
+        self.assertFalse(self.sdk.is_running)
+    
+    def test_continuous_capture_interval_excludes_capture_time(self):
+        """Test that slow captures do not stretch the capture interval"""
+        def slow_capture(background_write=False):
+            time.sleep(0.08)
+            return {"errors": []}
+        
+        with patch.object(self.sdk, 'capture_single_data', side_effect=slow_capture):
+            self.sdk.start_continuous_capture(interval=0.1, duration=0.5)
+            self.sdk.data_thread.join(timeout=5.0)
+        
+        # Sleeping a full interval after each capture would yield only 3
+        self.assertGreaterEqual(len(self.sdk.collected_data), 4)
+    
     @patch.object(JetsonCamera, 'capture_frame')
     @patch.object(JetsonLidar, 'get_single_measurement')
     def test_single_data_capture(self, mock_lidar_measure, mock_camera_capture):
@@ -332,6 +349,90 @@ class TestJetsonSDK(unittest.TestCase):
         self.assertIn("lidar", data)
         self.assertIn("errors", data)
 
+    def _mock_camera(self):
+        """Attach a mocked camera that returns a blank 480x640 frame"""
+        import numpy as np
+        
+        self.sdk.camera = Mock()
+        test_frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        self.sdk.camera.capture_frame.return_value = (True, test_frame)
+    
+    def test_single_capture_writes_image_before_returning(self):
+        """Test that a one-shot capture has its image on disk when it returns"""
+        self._mock_camera()
+        
+        data = self.sdk.capture_single_data()
+        
+        self.assertTrue(data["camera"]["success"])
+        self.assertTrue(data["camera"]["saved"])
+        self.assertTrue((self.test_output_dir / data["camera"]["filename"]).exists())
+        self.assertEqual(self.sdk.stats["images_captured"], 1)
+        self.assertIsNone(self.sdk.image_writer)
+    
+    def test_captured_image_written_in_background(self):
+        """Test that background image writes are flushed to disk"""
+        self._mock_camera()
+        
+        data = self.sdk.capture_single_data(background_write=True)
+        self.assertTrue(data["camera"]["success"])
+        
+        self.sdk._flush_image_writes()
+        self.assertTrue(data["camera"]["saved"])
+        self.assertTrue((self.test_output_dir / data["camera"]["filename"]).exists())
+        self.assertEqual(self.sdk.stats["images_captured"], 1)
+        self.assertEqual(self.sdk.stats["errors"], 0)
+    
+    def test_image_write_failure_recorded_in_capture(self):
+        """Test that a failed background write is recorded in the capture record"""
+        self._mock_camera()
+        
+        with patch('cv2.imwrite', return_value=False):
+            data = self.sdk.capture_single_data(background_write=True)
+            self.sdk._flush_image_writes()
+        
+        self.assertFalse(data["camera"]["success"])
+        self.assertFalse(data["camera"]["saved"])
+        self.assertEqual(len(data["errors"]), 1)
+        self.assertEqual(self.sdk.stats["images_captured"], 0)
+        self.assertEqual(self.sdk.stats["errors"], 1)
+    
+    def test_image_writes_dropped_when_queue_full(self):
+        """Test that frames are dropped rather than queued without limit"""
+        import threading
+        from main import _MAX_PENDING_IMAGE_WRITES
+        
+        self._mock_camera()
+        release_writer = threading.Event()
+        
+        def stalled_imwrite(filename, frame):
+            release_writer.wait(timeout=5.0)
+            return True
+        
+        with patch('cv2.imwrite', side_effect=stalled_imwrite):
+            queued = [self.sdk.capture_single_data(background_write=True)
+                      for _ in range(_MAX_PENDING_IMAGE_WRITES)]
+            dropped = self.sdk.capture_single_data(background_write=True)
+            
+            release_writer.set()
+            self.sdk._flush_image_writes()
+        
+        for data in queued:
+            self.assertTrue(data["camera"]["saved"])
+        self.assertIsNone(dropped["camera"])
+        self.assertEqual(len(dropped["errors"]), 1)
+        self.assertEqual(self.sdk.stats["images_captured"], _MAX_PENDING_IMAGE_WRITES)
+        self.assertEqual(self.sdk.stats["errors"], 1)
+    
+    def test_capture_after_cleanup_recreates_writer(self):
+        """Test that background writes still work after cleanup()"""
+        self.sdk.cleanup()
+        self._mock_camera()
+        
+        data = self.sdk.capture_single_data(background_write=True)
+        self.sdk._flush_image_writes()
+        
+        self.assertEqual(data["errors"], [])
+        self.assertTrue(data["camera"]["saved"])
 
 class TestErrorHandling(unittest.TestCase):
     """Test cases for error handling"""
@@ -380,13 +481,7 @@ class TestIntegration(unittest.TestCase):
         
         # Clean up test files
         if self.test_output_dir.exists():
-            for file in self.test_output_dir.rglob("*"):
-                if file.is_file():
-                    file.unlink()
-            for dir in sorted(self.test_output_dir.rglob("*"), reverse=True):
-                if dir.is_dir():
-                    dir.rmdir()
-            self.test_output_dir.rmdir()
+            shutil.rmtree(self.test_output_dir)
     
     def test_full_workflow(self):
         """Test complete SDK workflow"""
@@ -402,6 +497,16 @@ class TestIntegration(unittest.TestCase):
         self.sdk.cleanup()
 
 
+# Unit test cases run by main(), in order
+UNIT_TEST_CASES = (
+    TestJetsonCamera,
+    TestJetsonLidar,
+    TestJetsonSDK,
+    TestErrorHandling,
+    TestIntegration,
+)
+
+
 def run_hardware_tests():
     """Run tests that require actual hardware"""
     logger.info("Running hardware-dependent tests...")
@@ -495,13 +600,7 @@ def run_performance_tests():
     # Clean up test files
     test_dir = Path("perf_test_output")
     if test_dir.exists():
-        for file in test_dir.rglob("*"):
-            if file.is_file():
-                file.unlink()
-        for dir in sorted(test_dir.rglob("*"), reverse=True):
-            if dir.is_dir():
-                dir.rmdir()
-        test_dir.rmdir()
+        shutil.rmtree(test_dir)
 
 
 def main():
@@ -531,15 +630,11 @@ def main():
         logger.info("RUNNING UNIT TESTS")
         logger.info("=" * 50)
         
-        # Create test suite
-        test_suite = unittest.TestSuite()
-        
-        # Add test cases
-        test_suite.addTest(unittest.makeSuite(TestJetsonCamera))
-        test_suite.addTest(unittest.makeSuite(TestJetsonLidar))
-        test_suite.addTest(unittest.makeSuite(TestJetsonSDK))
-        test_suite.addTest(unittest.makeSuite(TestErrorHandling))
-        test_suite.addTest(unittest.makeSuite(TestIntegration))
+        # Create test suite from the unit test case table
+        loader = unittest.TestLoader()
+        test_suite = unittest.TestSuite(
+            loader.loadTestsFromTestCase(test_case) for test_case in UNIT_TEST_CASES
+        )
         
         # Run tests
         runner = unittest.TextTestRunner(verbosity=2 if args.verbose else 1)